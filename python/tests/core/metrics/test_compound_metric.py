@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Dict, Optional
 
 import numpy as np
 import pytest
@@ -12,6 +12,17 @@ from whylogs.core.metrics.metrics import (
 )
 from whylogs.core.preprocessing import PreprocessedColumn
 
+_ARR1 = np.array([10, 20, 30], dtype=np.int64)
+_COL1 = PreprocessedColumn.apply(_ARR1)
+_ARR2 = np.array([40, 50, 60], dtype=np.int64)
+_COL2 = PreprocessedColumn.apply(_ARR2)
+
+_CONFIG = MetricConfig()
+
+
+def _distribution_metrics(*names: str) -> Dict[str, DistributionMetric]:
+    return {name: DistributionMetric.zero(_CONFIG) for name in names}
+
 
 @custom_metric
 class GoodCM(CompoundMetric):
@@ -27,45 +38,27 @@ class GoodCM(CompoundMetric):
 
 
 def test_compound_metric() -> None:
-    metric = GoodCM(
-        {
-            "Metric1": DistributionMetric.zero(MetricConfig()),
-            "Metric2": DistributionMetric.zero(MetricConfig()),
-        },
-    )
-    data = [10, 20, 30]
-    arr = np.array(data)
-    col = PreprocessedColumn.apply(arr)
-    metric.columnar_update(col)
+    metric = GoodCM(_distribution_metrics("Metric1", "Metric2"))
+    metric.columnar_update(_COL1)
 
     assert metric.submetrics["Metric1"].kll.value.get_n() == 3
-    assert metric.submetrics["Metric2"].mean.value == arr.mean()
+    assert metric.submetrics["Metric2"].mean.value == _ARR1.mean()
 
 
 def test_add_submetric() -> None:
-    metric = GoodCM({"metric1": DistributionMetric.zero(MetricConfig())})
-    col = PreprocessedColumn.apply(np.array([1, 2, 3]))
+    metric = GoodCM(_distribution_metrics("metric1"))
+    col = PreprocessedColumn.apply(np.array([1, 2, 3], dtype=np.int64))
     metric.columnar_update(col)
-    metric.submetrics["metric2"] = DistributionMetric.zero(MetricConfig())
+    metric.submetrics["metric2"] = DistributionMetric.zero(_CONFIG)
     metric.columnar_update(col)
     assert metric.submetrics["metric1"].kll.value.get_n() == 6
     assert metric.submetrics["metric2"].kll.value.get_n() == 3
 
 
 def test_merge_symmetric_set_difference() -> None:
-    metric1 = GoodCM(
-        {
-            "metric1": DistributionMetric.zero(MetricConfig()),
-            "metric2": DistributionMetric.zero(MetricConfig()),
-        },
-    )
-    metric2 = GoodCM(
-        {
-            "metric2": DistributionMetric.zero(MetricConfig()),
-            "metric3": DistributionMetric.zero(MetricConfig()),
-        },
-    )
-    col = PreprocessedColumn.apply(np.array([1, 2, 3]))
+    metric1 = GoodCM(_distribution_metrics("metric1", "metric2"))
+    metric2 = GoodCM(_distribution_metrics("metric2", "metric3"))
+    col = PreprocessedColumn.apply(np.array([1, 2, 3], dtype=np.int64))
     metric1.columnar_update(col)
     metric2.columnar_update(col)
     merged = metric1 + metric2
@@ -75,17 +68,13 @@ def test_merge_symmetric_set_difference() -> None:
 
 
 def test_merge_submetrics_disagree() -> None:
-    metric1 = GoodCM(
-        {
-            "submetric": DistributionMetric.zero(MetricConfig()),
-        },
-    )
+    metric1 = GoodCM(_distribution_metrics("submetric"))
     metric2 = GoodCM(
         {
-            "submetric": IntsMetric.zero(MetricConfig()),
+            "submetric": IntsMetric.zero(_CONFIG),
         },
     )
-    col = PreprocessedColumn.apply(np.array([1, 2, 3]))
+    col = PreprocessedColumn.apply(np.array([1, 2, 3], dtype=np.int64))
     metric1.columnar_update(col)
     metric2.columnar_update(col)
     with pytest.raises(ValueError):
@@ -121,48 +110,33 @@ def test_slash_in_namespace_fails() -> None:
 
 
 @pytest.mark.parametrize(
-    "cls, metrics",
+    "cls, metrics_factory",
     [
-        (GoodCM, {"bad:name": DistributionMetric.zero(MetricConfig())}),
-        (GoodCM, {"bad/name": DistributionMetric.zero(MetricConfig())}),
+        (GoodCM, lambda: _distribution_metrics("bad:name")),
+        (GoodCM, lambda: _distribution_metrics("bad/name")),
     ],
 )
-def test_compound_metric_invalid_initialization(cls, metrics):
+def test_compound_metric_invalid_initialization(cls, metrics_factory):
+    metrics = metrics_factory()
     with pytest.raises(ValueError):
         cls(metrics)
 
 
 def test_compound_metric_serialization() -> None:
-    metric = GoodCM(
-        {
-            "Metric1": DistributionMetric.zero(MetricConfig()),
-            "Metric2": DistributionMetric.zero(MetricConfig()),
-        },
-    )
-    data = [10, 20, 30]
-    arr = np.array(data)
-    col = PreprocessedColumn.apply(arr)
-    metric.columnar_update(col)
+    metric = GoodCM(_distribution_metrics("Metric1", "Metric2"))
+    metric.columnar_update(_COL1)
     msg = metric.to_protobuf()
     deserialized = GoodCM.from_protobuf(msg)
 
     assert deserialized.namespace == metric.namespace
     assert deserialized.submetrics["Metric1"].kll.value.get_n() == 3
-    assert deserialized.submetrics["Metric2"].mean.value == arr.mean()
+    assert deserialized.submetrics["Metric2"].mean.value == _ARR1.mean()
     assert len(deserialized.submetrics) == 2
 
 
 def test_compound_metric_summary() -> None:
-    metric = GoodCM(
-        {
-            "Metric1": DistributionMetric.zero(MetricConfig()),
-            "Metric2": DistributionMetric.zero(MetricConfig()),
-        },
-    )
-    data = [10, 20, 30]
-    arr = np.array(data)
-    col = PreprocessedColumn.apply(arr)
-    metric.columnar_update(col)
+    metric = GoodCM(_distribution_metrics("Metric1", "Metric2"))
+    metric.columnar_update(_COL1)
     summary = metric.to_summary_dict(None)
 
     assert "Metric1/mean" in summary
@@ -172,31 +146,15 @@ def test_compound_metric_summary() -> None:
 
 
 def test_compound_metric_merge() -> None:
-    metric1 = GoodCM(
-        {
-            "Metric1": DistributionMetric.zero(MetricConfig()),
-            "Metric2": DistributionMetric.zero(MetricConfig()),
-        },
-    )
-    data1 = [10, 20, 30]
-    arr1 = np.array(data1)
-    col = PreprocessedColumn.apply(arr1)
-    metric1.columnar_update(col)
-    d1 = DistributionMetric.zero(MetricConfig())
-    d1.columnar_update(col)
-
-    metric2 = GoodCM(
-        {
-            "Metric1": DistributionMetric.zero(MetricConfig()),
-            "Metric2": DistributionMetric.zero(MetricConfig()),
-        },
-    )
-    data2 = [40, 50, 60]
-    arr2 = np.array(data2)
-    col = PreprocessedColumn.apply(arr2)
-    metric2.columnar_update(col)
-    d2 = DistributionMetric.zero(MetricConfig())
-    d2.columnar_update(col)
+    metric1 = GoodCM(_distribution_metrics("Metric1", "Metric2"))
+    metric1.columnar_update(_COL1)
+    d1 = DistributionMetric.zero(_CONFIG)
+    d1.columnar_update(_COL1)
+
+    metric2 = GoodCM(_distribution_metrics("Metric1", "Metric2"))
+    metric2.columnar_update(_COL2)
+    d2 = DistributionMetric.zero(_CONFIG)
+    d2.columnar_update(_COL2)
 
     merged = metric1 + metric2
     d_merged = d1 + d2
@@ -49,6 +49,15 @@ def test_max_component() -> None:
     assert res.value == 2
 
 
+def test_from_trusted_value_matches_init() -> None:
+    first = MaxIntegralComponent._from_trusted_value(1)
+    second = MaxIntegralComponent._from_trusted_value(2)
+    assert "_value" not in MaxIntegralComponent.__dict__["_resolved_fields"]
+    assert second.value == 2
+    assert vars(second).keys() == vars(MaxIntegralComponent(2)).keys()
+    assert (first + second).value == 2
+
+
 def test_component_deepcopy() -> None:
     orig = FrequentStringsComponent(ds.frequent_strings_sketch(lg_max_k=10))
     copy1 = deepcopy(orig)
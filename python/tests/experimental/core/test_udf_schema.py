@@ -1,8 +1,11 @@
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, Generator, KeysView, List, Union
 
+import numpy as np
 import pandas as pd
+import pytest
 
 import whylogs as why
+from whylogs.api.logger.result_set import ResultSet
 from whylogs.core.dataset_profile import DatasetProfile
 from whylogs.core.datatypes import Fractional, Integral, String
 from whylogs.core.metrics import (
@@ -27,6 +30,60 @@ from whylogs.experimental.core.udf_schema import (
 from whylogs.experimental.core.validators import condition_validator
 
 
+@pytest.fixture(scope="module")
+def unit_tests_udfs() -> Generator[None, None, None]:
+    # registered only while this module's tests run, so the global registry
+    # doesn't carry them into every other udf_schema() call
+    register_dataset_udf(["col1"], schema_name="unit-tests")(add5)
+    register_dataset_udf(
+        ["col1"], "annihilate_me", anti_metrics=[CardinalityMetric, DistributionMetric], schema_name="unit-tests"
+    )(plus1)
+    register_dataset_udf(["col1"], "colliding_name", namespace="pluto", schema_name="unit-tests")(a_function)
+    register_dataset_udf(["col1"], "colliding_name", namespace="neptune", schema_name="unit-tests")(another_function)
+    register_dataset_udf(["col1", "col2"], "product", schema_name="unit-tests")(times)
+    register_dataset_udf(
+        ["col1", "col3"], metrics=[MetricSpec(StandardMetric.distribution.value)], schema_name="unit-tests"
+    )(ratio)
+    register_dataset_udf(["oops"], schema_name="unit-tests")(exothermic)
+    yield
+    for name, namespace in [
+        ("add5", None),
+        ("annihilate_me", None),
+        ("colliding_name", "pluto"),
+        ("colliding_name", "neptune"),
+        ("product", None),
+        ("ratio", None),
+        ("exothermic", None),
+    ]:
+        unregister_udf(name, namespace, schema_name="unit-tests")
+
+
+@pytest.fixture(scope="module")
+def unit_tests_schema(unit_tests_udfs: None) -> UdfSchema:
+    # built once from the dataset UDFs registered by unit_tests_udfs plus the
+    # type UDFs still registered at import; tests must use a copy() since
+    # logging resolves new columns into the schema
+    return udf_schema(schema_name="unit-tests")
+
+
+# shared inputs; logging never mutates them
+_MIXED_DF = pd.DataFrame({"col1": np.array([42, 12, 7], dtype=np.int64), "col2": ["a", "b", "c"]})
+_MIXED_ROW = {"col1": 42, "col2": "a"}
+_NUMERIC_DF = pd.DataFrame(
+    {
+        "col1": np.array([42, 12, 7], dtype=np.int64),
+        "col2": np.array([2, 3, 4], dtype=np.int64),
+        "col3": np.array([2, 3, 4], dtype=np.int64),
+    }
+)
+_NUMERIC_ROW = {"col1": 42, "col2": 2, "col3": 2}
+
+
+def _profiled_columns(results: ResultSet) -> KeysView[str]:
+    # column names only; view() would flush and snapshot every column
+    return results.profile()._columns.keys()
+
+
 def test_udf_row() -> None:
     schema = UdfSchema(
         STANDARD_RESOLVER,
@@ -46,7 +103,7 @@ def test_udf_pandas() -> None:
         STANDARD_RESOLVER,
         udf_specs=[UdfSpec(column_names=["col1"], udfs={"col2": lambda x: x["col1"], "col3": lambda x: x["col1"]})],
     )
-    data = pd.DataFrame({"col1": [42, 12, 7]})
+    data = pd.DataFrame({"col1": np.array([42, 12, 7], dtype=np.int64)})
     results = why.log(pandas=data, schema=schema).view()
     col1 = results.get_column("col1").to_summary_dict()
     col2 = results.get_column("col2").to_summary_dict()
@@ -56,59 +113,76 @@ def test_udf_pandas() -> None:
 
 
 @register_multioutput_udf(["xx1", "xx2"])
-def f1(x: Union[Dict[str, List], pd.DataFrame]) -> Union[Dict[str, List], pd.DataFrame]:
-    if isinstance(x, dict):
-        return {"foo": [x["xx1"][0]], "bar": [x["xx2"][0]]}
-    else:
-        return pd.DataFrame({"foo": x["xx1"], "bar": x["xx2"]})
+def f1(x: Union[Dict[str, List], pd.DataFrame]) -> Dict[str, Union[List, pd.Series]]:
+    return {"foo": x["xx1"], "bar": x["xx2"]}
 
 
 @register_multioutput_udf(["xx1", "xx2"], prefix="blah")
-def f2(x: Union[Dict[str, List], pd.DataFrame]) -> Union[Dict[str, List], pd.DataFrame]:
-    if isinstance(x, dict):
-        return {"foo": [x["xx1"][0]], "bar": [x["xx2"][0]]}
-    else:
-        return pd.DataFrame({"foo": x["xx1"], "bar": x["xx2"]})
+def f2(x: Union[Dict[str, List], pd.DataFrame]) -> Dict[str, Union[List, pd.Series]]:
+    return {"foo": x["xx1"], "bar": x["xx2"]}
 
 
 def test_multioutput_udf_row() -> None:
     schema = udf_schema()
     row = {"xx1": 42, "xx2": 3.14}
-    results = why.log(row, schema=schema).view()
-    assert results.get_column("f1.foo") is not None
-    assert results.get_column("f1.bar") is not None
-    assert results.get_column("blah.foo") is not None
-    assert results.get_column("blah.bar") is not None
+    columns = _profiled_columns(why.log(row, schema=schema))
+    assert "f1.foo" in columns
+    assert "f1.bar" in columns
+    assert "blah.foo" in columns
+    assert "blah.bar" in columns
 
 
 def test_multioutput_udf_dataframe() -> None:
     schema = udf_schema()
-    df = pd.DataFrame({"xx1": [42, 7], "xx2": [3.14, 2.72]})
-    results = why.log(df, schema=schema).view()
-    assert results.get_column("f1.foo") is not None
-    assert results.get_column("f1.bar") is not None
-    assert results.get_column("blah.foo") is not None
-    assert results.get_column("blah.bar") is not None
+    df = pd.DataFrame({"xx1": np.array([42, 7], dtype=np.int64), "xx2": np.array([3.14, 2.72], dtype=np.float64)})
+    columns = _profiled_columns(why.log(df, schema=schema))
+    assert "f1.foo" in columns
+    assert "f1.bar" in columns
+    assert "blah.foo" in columns
+    assert "blah.bar" in columns
+
+
+def add5(x: Union[Dict[str, List], pd.DataFrame]) -> np.ndarray:
+    return np.asarray(x["col1"]) + 5
 
 
-@register_dataset_udf(["col1"], schema_name="unit-tests")
-def add5(x: Union[Dict[str, List], pd.DataFrame]) -> Union[List, pd.Series]:
-    return [xx + 5 for xx in x["col1"]]
+def square(x: Union[Dict[str, List], pd.DataFrame]) -> np.ndarray:
+    a = np.asarray(x["col1"])
+    return a * a
 
 
-def square(x: Union[Dict[str, List], pd.DataFrame]) -> Union[List, pd.Series]:
-    return x["col1"] * x["col1"] if isinstance(x, (pd.Series, pd.DataFrame)) else [xx * xx for xx in x["col1"]]
+_SQUARE_SPEC = UdfSpec(["col1"], {"sqr": square})
 
+_COUNT_ONLY_RESOLVERS = [
+    ResolverSpec(
+        column_type=Integral,
+        metrics=[MetricSpec(StandardMetric.counts.value)],
+    ),
+    ResolverSpec(
+        column_type=Fractional,
+        metrics=[MetricSpec(StandardMetric.counts.value)],
+    ),
+    ResolverSpec(
+        column_type=String,
+        metrics=[MetricSpec(StandardMetric.counts.value)],
+    ),
+]
 
-action_list = []
+
+action_list = set()
+
+
+@pytest.fixture(autouse=True)
+def _reset_actions() -> None:
+    action_list.clear()
 
 
 def do_something_important(validator_name, condition_name: str, value: Any, column_id=None):
     print("Validator: {}\n    Condition name {} failed for value {}".format(validator_name, condition_name, value))
-    action_list.append(value)
+    action_list.add(value)
     if column_id:
-        # this list is just to verify that the action was called with the correct column id
-        action_list.append(column_id)
+        # this set is just to verify that the action was called with the correct column id
+        action_list.add(column_id)
     return
 
 
@@ -118,16 +192,13 @@ def lt_4(x):
 
 
 def test_validator_udf_pandas() -> None:
-    global action_list
-    data = pd.DataFrame({"col1": [1, 3, 7]})
+    data = pd.DataFrame({"col1": np.array([1, 3, 7], dtype=np.int64)})
     schema = udf_schema()
-    why.log(data, schema=schema).view()
+    why.log(data, schema=schema)
     assert 7 in action_list
 
 
 def test_validator_double_register_udf_pandas() -> None:
-    global action_list
-
     @condition_validator(["col1", "add5"], condition_name="less_than_four", actions=[do_something_important])
     def lt_4_2(x):
         return x < 4
@@ -138,45 +209,42 @@ def test_validator_double_register_udf_pandas() -> None:
     assert len(schema.validators["col1"]) == 1
 
 
-def test_validator_udf_row_with_id() -> None:
-    global action_list
+def test_validator_udf_pandas_with_id() -> None:
     config = MetricConfig(identity_column="cid")
     schema = udf_schema(default_config=config)
-    data = [{"col1": 1, "cid": "c1"}, {"col1": 3, "cid": "c2"}, {"col1": 9, "cid": "c3"}]
-    for d in data:
-        why.log(d, schema=schema).view()
+    data = pd.DataFrame([{"col1": 1, "cid": "c1"}, {"col1": 3, "cid": "c2"}, {"col1": 9, "cid": "c3"}])
+    why.log(data, schema=schema)
     assert 9 in action_list
     assert "c3" in action_list
 
 
+def test_validator_udf_row_with_id() -> None:
+    config = MetricConfig(identity_column="cid")
+    schema = udf_schema(default_config=config)
+    why.log({"col1": 11, "cid": "c4"}, schema=schema)
+    assert 11 in action_list
+    assert "c4" in action_list
+
+
 def test_validator_udf_homogeneous() -> None:
-    d = {"col1": [42, 2, 3, 1]}
+    d = {"col1": np.array([42, 2, 3, 1], dtype=np.int64)}
     df = pd.DataFrame(data=d)
     types = {
         "col1": (int, ColumnProperties.homogeneous),  # only this one should take the homogeneous code path
     }
     schema = udf_schema(types=types)
-    why.log(df, schema=schema).view()
+    why.log(df, schema=schema)
     assert 42 in action_list
 
 
-def test_decorator_pandas() -> None:
-    extra_spec = UdfSpec(["col1"], {"sqr": square})
-    schema = udf_schema([extra_spec], STANDARD_RESOLVER, schema_name="unit-tests")
-    data = pd.DataFrame({"col1": [42, 12, 7], "col2": ["a", "b", "c"]})
-    results = why.log(pandas=data, schema=schema).view()
-    col1_summary = results.get_column("col1").to_summary_dict()
-    assert "distribution/n" in col1_summary
-    add5_summary = results.get_column("add5").to_summary_dict()
-    assert "distribution/n" in add5_summary
-    sqr_summary = results.get_column("sqr").to_summary_dict()
-    assert "distribution/n" in sqr_summary
-
-
-def test_decorator_row() -> None:
-    extra_spec = UdfSpec(["col1"], {"sqr": square})
-    schema = udf_schema([extra_spec], STANDARD_RESOLVER, schema_name="unit-tests")
-    results = why.log(row={"col1": 42, "col2": "a"}, schema=schema).view()
+@pytest.mark.parametrize(
+    "data",
+    [_MIXED_DF, _MIXED_ROW],
+    ids=["pandas", "row"],
+)
+def test_decorator(data: Union[pd.DataFrame, Dict[str, Any]], unit_tests_udfs: None) -> None:
+    schema = udf_schema([_SQUARE_SPEC], STANDARD_RESOLVER, schema_name="unit-tests")
+    results = why.log(data, schema=schema).view()
     col1_summary = results.get_column("col1").to_summary_dict()
     assert "distribution/n" in col1_summary
     add5_summary = results.get_column("add5").to_summary_dict()
@@ -185,16 +253,13 @@ def test_decorator_row() -> None:
     assert "distribution/n" in sqr_summary
 
 
-@register_dataset_udf(
-    ["col1"], "annihilate_me", anti_metrics=[CardinalityMetric, DistributionMetric], schema_name="unit-tests"
-)
-def plus1(x: Union[Dict[str, List], pd.DataFrame]) -> Union[List, pd.Series]:
-    return x["col1"] + 1 if isinstance(x, pd.DataFrame) else map(lambda i: i + 1, x["col1"])
+def plus1(x: Union[Dict[str, List], pd.DataFrame]) -> np.ndarray:
+    return np.asarray(x["col1"]) + 1
 
 
-def test_anti_resolver() -> None:
-    schema = udf_schema(schema_name="unit-tests")
-    data = pd.DataFrame({"col1": [42, 12, 7], "col2": ["a", "b", "c"]})
+def test_anti_resolver(unit_tests_schema: UdfSchema) -> None:
+    schema = unit_tests_schema.copy()
+    data = _MIXED_DF
     results = why.log(pandas=data, schema=schema).view()
     col1_summary = results.get_column("col1").to_summary_dict()
     assert "distribution/n" in col1_summary
@@ -211,93 +276,47 @@ def test_anti_resolver() -> None:
     assert "cardinality/est" not in plus1_summary
 
 
-@register_dataset_udf(["col1"], "colliding_name", namespace="pluto", schema_name="unit-tests")
+def test_anti_resolver_row(unit_tests_schema: UdfSchema) -> None:
+    results = why.log(row=_MIXED_ROW, schema=unit_tests_schema.copy()).view()
+    plus1_summary = results.get_column("annihilate_me").to_summary_dict()
+    assert plus1_summary["counts/null"] == 0
+    assert plus1_summary["ints/max"] == 43
+    assert "distribution/n" not in plus1_summary
+
+
 def a_function(x: Union[Dict[str, List], pd.DataFrame]) -> Union[List, pd.Series]:
     return x["col1"]
 
 
-@register_dataset_udf(["col1"], "colliding_name", namespace="neptune", schema_name="unit-tests")
 def another_function(x: Union[Dict[str, List], pd.DataFrame]) -> Union[List, pd.Series]:
     return x["col1"]
 
 
-def test_namespace() -> None:
-    results = why.log(row={"col1": 42}, schema=udf_schema(schema_name="unit-tests")).view()
-    assert results.get_column("pluto.colliding_name") is not None
-    assert results.get_column("neptune.colliding_name") is not None
+def test_namespace(unit_tests_schema: UdfSchema) -> None:
+    columns = _profiled_columns(why.log(row={"col1": 42}, schema=unit_tests_schema.copy()))
+    assert "pluto.colliding_name" in columns
+    assert "neptune.colliding_name" in columns
 
 
-@register_dataset_udf(["col1", "col2"], "product", schema_name="unit-tests")
-def times(x: Union[Dict[str, List], pd.DataFrame]) -> Union[List, pd.Series]:
-    return [xx * yy for xx, yy in zip(x["col1"], x["col2"])]
+def times(x: Union[Dict[str, List], pd.DataFrame]) -> np.ndarray:
+    return np.asarray(x["col1"]) * np.asarray(x["col2"])
 
 
-@register_dataset_udf(
-    ["col1", "col3"], metrics=[MetricSpec(StandardMetric.distribution.value)], schema_name="unit-tests"
-)
-def ratio(x: Union[Dict[str, List], pd.DataFrame]) -> Union[List, pd.Series]:
-    return [xx / yy for xx, yy in zip(x["col1"], x["col3"])]
-
-
-def test_multicolumn_udf_pandas() -> None:
-    count_only = [
-        ResolverSpec(
-            column_type=Integral,
-            metrics=[MetricSpec(StandardMetric.counts.value)],
-        ),
-        ResolverSpec(
-            column_type=Fractional,
-            metrics=[MetricSpec(StandardMetric.counts.value)],
-        ),
-        ResolverSpec(
-            column_type=String,
-            metrics=[MetricSpec(StandardMetric.counts.value)],
-        ),
-    ]
-
-    extra_spec = UdfSpec(["col1"], {"sqr": square})
-    schema = udf_schema([extra_spec], count_only, schema_name="unit-tests")
-    data = pd.DataFrame({"col1": [42, 12, 7], "col2": [2, 3, 4], "col3": [2, 3, 4]})
-    results = why.log(pandas=data, schema=schema).view()
-    col1_summary = results.get_column("col1").to_summary_dict()
-    assert "counts/n" in col1_summary
-    col2_summary = results.get_column("col2").to_summary_dict()
-    assert "counts/n" in col2_summary
-    col3_summary = results.get_column("col3").to_summary_dict()
-    assert "counts/n" in col3_summary
-    add5_summary = results.get_column("add5").to_summary_dict()
-    assert "counts/n" in add5_summary
-    prod_summary = results.get_column("product").to_summary_dict()
-    assert prod_summary["counts/n"] == 3
-    sqr_summary = results.get_column("sqr").to_summary_dict()
-    assert "counts/n" in sqr_summary
-    div_summary = results.get_column("ratio").to_summary_dict()
-    assert div_summary["distribution/n"] == 3
-    # Integral -> counts plus registered distribution
-    assert results.get_column("ratio").get_metric("counts") is not None
-    assert results.get_column("ratio").get_metric("distribution") is not None
+def ratio(x: Union[Dict[str, List], pd.DataFrame]) -> np.ndarray:
+    return np.true_divide(np.asarray(x["col1"]), np.asarray(x["col3"]))
 
 
-def test_multicolumn_udf_row() -> None:
-    count_only = [
-        ResolverSpec(
-            column_type=Integral,
-            metrics=[MetricSpec(StandardMetric.counts.value)],
-        ),
-        ResolverSpec(
-            column_type=Fractional,
-            metrics=[MetricSpec(StandardMetric.counts.value)],
-        ),
-        ResolverSpec(
-            column_type=String,
-            metrics=[MetricSpec(StandardMetric.counts.value)],
-        ),
-    ]
-
-    extra_spec = UdfSpec(["col1"], {"sqr": square})
-    schema = udf_schema([extra_spec], count_only, schema_name="unit-tests")
-    data = {"col1": 42, "col2": 2, "col3": 2}
-    results = why.log(row=data, schema=schema).view()
+@pytest.mark.parametrize(
+    "data,rows",
+    [
+        (_NUMERIC_DF, 3),
+        (_NUMERIC_ROW, 1),
+    ],
+    ids=["pandas", "row"],
+)
+def test_multicolumn_udf(data: Union[pd.DataFrame, Dict[str, Any]], rows: int, unit_tests_udfs: None) -> None:
+    schema = udf_schema([_SQUARE_SPEC], _COUNT_ONLY_RESOLVERS, schema_name="unit-tests")
+    results = why.log(data, schema=schema).view()
     col1_summary = results.get_column("col1").to_summary_dict()
     assert "counts/n" in col1_summary
     col2_summary = results.get_column("col2").to_summary_dict()
@@ -307,11 +326,11 @@ def test_multicolumn_udf_row() -> None:
     add5_summary = results.get_column("add5").to_summary_dict()
     assert "counts/n" in add5_summary
     prod_summary = results.get_column("product").to_summary_dict()
-    assert prod_summary["counts/n"] == 1
+    assert prod_summary["counts/n"] == rows
     sqr_summary = results.get_column("sqr").to_summary_dict()
     assert "counts/n" in sqr_summary
     div_summary = results.get_column("ratio").to_summary_dict()
-    assert div_summary["distribution/n"] == 1
+    assert div_summary["distribution/n"] == rows
     # Integral -> counts plus registered distribution
     assert results.get_column("ratio").get_metric("counts") is not None
     assert results.get_column("ratio").get_metric("distribution") is not None
@@ -320,7 +339,6 @@ def test_multicolumn_udf_row() -> None:
 n: int = 0
 
 
-@register_dataset_udf(["oops"], schema_name="unit-tests")
 def exothermic(x: Union[Dict[str, List], pd.DataFrame]) -> Union[List, pd.Series]:
     global n
     n += 1
@@ -330,11 +348,11 @@ def exothermic(x: Union[Dict[str, List], pd.DataFrame]) -> Union[List, pd.Series
     return x["oops"]
 
 
-def test_udf_throws_pandas() -> None:
+def test_udf_throws_pandas(unit_tests_schema: UdfSchema) -> None:
     global n
     n = 0
-    schema = udf_schema(schema_name="unit-tests")
-    df = pd.DataFrame({"oops": [1, 2, 3, 4], "ok": [5, 6, 7, 8]})
+    schema = unit_tests_schema.copy()
+    df = pd.DataFrame({"oops": np.array([1, 2, 3, 4], dtype=np.int64), "ok": np.array([5, 6, 7, 8], dtype=np.int64)})
     results = why.log(pandas=df, schema=schema).view()
     assert "exothermic" in results.get_columns()
     oops_summary = results.get_column("exothermic").to_summary_dict()
@@ -343,27 +361,29 @@ def test_udf_throws_pandas() -> None:
     assert ok_summary["counts/n"] == 4
 
 
-def test_udf_throws_row() -> None:
+def test_udf_throws_row(unit_tests_schema: UdfSchema) -> None:
     global n
     n = 0
-    schema = udf_schema(schema_name="unit-tests")
+    schema = unit_tests_schema.copy()
     data = {"oops": 1, "ok": 5}
     profile = why.log(row=data, schema=schema).profile()
     profile.track(row=data)
     profile.flush()
-    ok_summary = profile.view().get_column("ok").to_summary_dict()
+    view = profile.view()
+    ok_summary = view.get_column("ok").to_summary_dict()
     assert ok_summary["counts/n"] == 2
     assert ok_summary["counts/null"] == 0
-    oops_summary = profile.view().get_column("exothermic").to_summary_dict()
+    oops_summary = view.get_column("exothermic").to_summary_dict()
     assert oops_summary["counts/n"] == 2
     assert oops_summary["counts/null"] == 2
-    profile.track(row=data)
-    profile.track(row=data)
+    # the UDF has stopped throwing, so the remaining rows can go in as one batch
+    profile.track(pandas=pd.DataFrame([data, data]))
     profile.flush()
-    oops_summary = profile.view().get_column("exothermic").to_summary_dict()
+    view = profile.view()
+    oops_summary = view.get_column("exothermic").to_summary_dict()
     assert oops_summary["counts/n"] == 4
     assert oops_summary["counts/null"] == 2
-    ok_summary = profile.view().get_column("ok").to_summary_dict()
+    ok_summary = view.get_column("ok").to_summary_dict()
     assert ok_summary["counts/n"] == 4
     assert ok_summary["counts/null"] == 0
 
@@ -373,9 +393,9 @@ def bar(x: Any) -> Any:
     return x
 
 
-def test_udf_metric_resolving() -> None:
-    schema = udf_schema(schema_name="unit-tests")
-    df = pd.DataFrame({"col1": [1, 2, 3], "foo": [1, 2, 3]})
+def test_udf_metric_resolving(unit_tests_schema: UdfSchema) -> None:
+    schema = unit_tests_schema.copy()
+    df = pd.DataFrame({"col1": np.array([1, 2, 3], dtype=np.int64), "foo": np.array([1, 2, 3], dtype=np.int64)})
     results = why.log(pandas=df, schema=schema).view()
     assert "add5" in results.get_columns()
     assert results.get_column("add5").to_summary_dict()["counts/n"] == 3
@@ -384,34 +404,34 @@ def test_udf_metric_resolving() -> None:
     assert "udf/bar:counts/n" in foo_summary
 
 
-def test_udf_segmentation_pandas() -> None:
+def test_udf_segmentation_pandas(unit_tests_udfs: None) -> None:
     column_segments = segment_on_column("product")
     segmented_schema = udf_schema(segments=column_segments, schema_name="unit-tests")
-    data = pd.DataFrame({"col1": [42, 12, 7], "col2": [2, 3, 4], "col3": [2, 3, 4]})
+    data = _NUMERIC_DF
     results = why.log(pandas=data, schema=segmented_schema)
     assert len(results.segments()) == 3
 
 
-def test_udf_segmentation_row() -> None:
+def test_udf_segmentation_row(unit_tests_udfs: None) -> None:
     column_segments = segment_on_column("product")
     segmented_schema = udf_schema(segments=column_segments, schema_name="unit-tests")
-    data = {"col1": 42, "col2": 2, "col3": 2}
+    data = _NUMERIC_ROW
     results = why.log(row=data, schema=segmented_schema)
     assert len(results.segments()) == 1
 
 
-def test_udf_segmentation_obj() -> None:
+def test_udf_segmentation_obj(unit_tests_udfs: None) -> None:
     column_segments = segment_on_column("product")
     segmented_schema = udf_schema(segments=column_segments, schema_name="unit-tests")
-    data = {"col1": 42, "col2": 2, "col3": 2}
+    data = _NUMERIC_ROW
     results = why.log(data, schema=segmented_schema)
     assert len(results.segments()) == 1
 
 
-def test_udf_track() -> None:
-    schema = udf_schema(schema_name="unit-tests")
+def test_udf_track(unit_tests_schema: UdfSchema) -> None:
+    schema = unit_tests_schema.copy()
     prof = DatasetProfile(schema)
-    data = pd.DataFrame({"col1": [42, 12, 7], "col2": [2, 3, 4], "col3": [2, 3, 4]})
+    data = _NUMERIC_DF
     prof.track(data)
     results = prof.view()
     col1_summary = results.get_column("col1").to_summary_dict()
@@ -439,13 +459,13 @@ def rob(x: Any) -> Any:
 
 
 @register_dataset_udf(["schema.col1"], "add5")
-def fob(x: Union[Dict[str, List], pd.DataFrame]) -> Union[List, pd.Series]:
-    return x["schema.col1"] + 5 if isinstance(x, pd.DataFrame) else [xx + 5 for xx in x["schema.col1"]]
+def fob(x: Union[Dict[str, List], pd.DataFrame]) -> np.ndarray:
+    return np.asarray(x["schema.col1"]) + 5
 
 
 def test_schema_name() -> None:
     default_schema = udf_schema()
-    data = pd.DataFrame({"schema.col1": [42, 12, 7]})
+    data = pd.DataFrame({"schema.col1": np.array([42, 12, 7], dtype=np.int64)})
     default_view = why.log(data, schema=default_schema).view()
     assert "add5" in default_view.get_columns()
     assert "bob" not in default_view.get_columns()
@@ -466,7 +486,7 @@ def test_schema_name() -> None:
 
 def test_schema_list() -> None:
     schema = udf_schema(schema_name=["", "bob"])
-    data = pd.DataFrame({"schema.col1": [42, 12, 7]})
+    data = pd.DataFrame({"schema.col1": np.array([42, 12, 7], dtype=np.int64)})
     result = why.log(data, schema=schema).view()
     assert "add5" in result.get_columns()
     assert "bob" in result.get_columns()
@@ -487,7 +507,7 @@ def test_schema_list() -> None:
 
 def test_direct_udfs() -> None:
     schema = udf_schema(schema_name=["", "bob"])
-    data = pd.DataFrame({"col1": [42, 12, 7]})
+    data = pd.DataFrame({"col1": np.array([42, 12, 7], dtype=np.int64)})
     more_data, _ = schema.apply_udfs(data)
     udf_columns = set(more_data.keys())
 
@@ -501,12 +521,13 @@ def test_direct_udfs() -> None:
 
 
 @register_type_udf(Fractional, schema_name="unit-tests")
-def square_type(x: Union[List, pd.Series]) -> Union[List, pd.Series]:
-    return x * x if isinstance(x, pd.Series) else [xx * xx for xx in x]
+def square_type(x: Union[List, pd.Series]) -> np.ndarray:
+    a = np.asarray(x)
+    return a * a
 
 
-def test_type_udf_row() -> None:
-    schema = udf_schema(schema_name="unit-tests")
+def test_type_udf_row(unit_tests_schema: UdfSchema) -> None:
+    schema = unit_tests_schema.copy()
     data = {"col1": 3.14}
     results = why.log(row=data, schema=schema).view()
     assert "col1.square_type" in results.get_columns().keys()
@@ -515,9 +536,9 @@ def test_type_udf_row() -> None:
     assert summary["types/fractional"] == 1
 
 
-def test_type_udf_dataframe() -> None:
-    schema = udf_schema(schema_name="unit-tests")
-    data = pd.DataFrame({"col1": [3.14, 42.0]})
+def test_type_udf_dataframe(unit_tests_schema: UdfSchema) -> None:
+    schema = unit_tests_schema.copy()
+    data = pd.DataFrame({"col1": np.array([3.14, 42.0], dtype=np.float64)})
     results = why.log(data, schema=schema).view()
     assert "col1.square_type" in results.get_columns().keys()
     summary = results.get_column("col1.square_type").to_summary_dict()
@@ -526,13 +547,14 @@ def test_type_udf_dataframe() -> None:
 
 
 @register_type_udf(float, schema_name="unit-tests")
-def square_python_type(x: Union[List, pd.Series]) -> Union[List, pd.Series]:
-    return x * x if isinstance(x, pd.Series) else [xx * xx for xx in x]
+def square_python_type(x: Union[List, pd.Series]) -> np.ndarray:
+    a = np.asarray(x)
+    return a * a
 
 
-def test_python_type_udf() -> None:
-    schema = udf_schema(schema_name="unit-tests")
-    data = pd.DataFrame({"col1": [3.14, 42.0]})
+def test_python_type_udf(unit_tests_schema: UdfSchema) -> None:
+    schema = unit_tests_schema.copy()
+    data = pd.DataFrame({"col1": np.array([3.14, 42.0], dtype=np.float64)})
     results = why.log(data, schema=schema).view()
     assert "col1.square_python_type" in results.get_columns().keys()
     summary = results.get_column("col1.square_python_type").to_summary_dict()
@@ -543,6 +565,7 @@ def test_python_type_udf() -> None:
 def test_schema_copy() -> None:
     schema = udf_schema()
     copy = schema.copy()
+    assert isinstance(copy, UdfSchema)
     assert isinstance(copy.resolvers, type(schema.resolvers))
     # Should be copy.resolvers._resolvers == schema.resolvers._resovlers, but
     # some of the elements don't implement a proper == predicate
@@ -553,21 +576,30 @@ def test_schema_copy() -> None:
     assert schema.type_udfs == copy.type_udfs
 
 
-@register_dataset_udf(["col1"], metrics=[MetricSpec(StandardMetric.frequent_items.value)], schema_name="unit-tests")
 def unregister_me(x):
     return 42.0
 
 
 def test_unregister() -> None:
-    schema = udf_schema(schema_name="unit-tests")
-    data = {"col1": 42, "col2": 2, "col3": 2}
-    results = why.log(row=data, schema=schema).view()
-    udf_summary = results.get_column("unregister_me").to_summary_dict()
-    assert "frequent_items/frequent_strings" in udf_summary
-    unregister_udf("unregister_me", schema_name="unit-tests")
-    schema = udf_schema(schema_name="unit-tests")
-    results = why.log(row=data, schema=schema).view()
-    assert "unregister_me" not in results.get_columns()
-    from whylogs.experimental.core.udf_schema import _resolver_specs
-
-    assert "unregister_me" not in [spec.column_name for spec in _resolver_specs["unit-tests"]]
+    register_dataset_udf(["col1"], metrics=[MetricSpec(StandardMetric.frequent_items.value)], schema_name="unit-tests")(
+        unregister_me
+    )
+    registered = True
+    try:
+        schema = udf_schema(schema_name="unit-tests")
+        data = _NUMERIC_ROW
+        results = why.log(row=data, schema=schema).view()
+        udf_summary = results.get_column("unregister_me").to_summary_dict()
+        assert "frequent_items/frequent_strings" in udf_summary
+        unregister_udf("unregister_me", schema_name="unit-tests")
+        registered = False
+        schema = udf_schema(schema_name="unit-tests")
+        results = why.log(row=data, schema=schema).view()
+        assert "unregister_me" not in results.get_columns()
+        from whylogs.experimental.core.udf_schema import _resolver_specs
+
+        assert "unregister_me" not in [spec.column_name for spec in _resolver_specs["unit-tests"]]
+    finally:
+        # keep a failed assertion from leaking the spec into later tests
+        if registered:
+            unregister_udf("unregister_me", schema_name="unit-tests")
@@ -1,6 +1,7 @@
 import os
 
-from whylogs.migration.converters import read_v0_to_view
+from whylogs.core.proto.v0 import ColumnMessageV0, DatasetProfileMessageV0
+from whylogs.migration.converters import read_v0_to_view, v0_to_v1_view
 
 script_dir = os.path.dirname(os.path.realpath(__file__))
 
@@ -8,3 +9,11 @@ script_dir = os.path.dirname(os.path.realpath(__file__))
 def test_convert_v0_to_v1_view(v0_profile_path: str) -> None:
     v1_view = read_v0_to_view(v0_profile_path)
     assert len(v1_view.to_pandas()) == 22
+
+
+def test_convert_v0_column_without_sketches() -> None:
+    msg = DatasetProfileMessageV0(columns={"empty": ColumnMessageV0()})
+    v1_view = v0_to_v1_view(msg)
+    column = v1_view.get_column("empty")
+    assert column.get_metric("distribution").kll.value.is_empty()
+    assert column.get_metric("frequent_items").frequent_strings.value.is_empty()
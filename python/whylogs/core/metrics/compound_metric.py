@@ -47,8 +47,9 @@ class CompoundMetric(Metric, ABC):
             hyphens, and underscores.
         """
 
-        if ":" in self.namespace or "/" in self.namespace:
-            raise ValueError(f"Invalid namespace {self.namespace}")
+        namespace = self.namespace
+        if ":" in namespace or "/" in namespace:
+            raise ValueError(f"Invalid namespace {namespace}")
         for sub_name, submetric in submetrics.items():
             if ":" in sub_name or "/" in sub_name:
                 raise ValueError(f"Invalid submetric name {sub_name}")
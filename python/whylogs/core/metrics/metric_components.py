@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Generic, Optional, Type, TypeVar
+from typing import Any, Dict, Generic, Optional, Type, TypeVar
 
 import whylogs_sketching as ds  # type: ignore
 
@@ -62,6 +62,20 @@ class MetricComponent(Generic[T]):
         if self._serializer is not None and self._deserializer is None:
             raise ValueError("Serializer and deserializer must be defined in pairs, but deserializer is None")
 
+    @classmethod
+    def _from_trusted_value(cls: Type["M"], value: Any) -> "M":
+        # reuses the registry lookups resolved by the first instance of this exact class instead of redoing them in
+        # __init__; only the value differs between instances
+        fields: Optional[Dict[str, Any]] = cls.__dict__.get("_resolved_fields")
+        if fields is None:
+            component = cls(value)
+            setattr(cls, "_resolved_fields", {k: v for k, v in vars(component).items() if k != "_value"})
+            return component
+        component = cls.__new__(cls)
+        component.__dict__.update(fields)
+        component._value = value
+        return component
+
     @property
     def value(self) -> T:
         return self._value
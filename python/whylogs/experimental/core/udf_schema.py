@@ -21,7 +21,7 @@ from whylogs.core.resolvers import NO_FI_RESOLVER, MetricSpec, ResolverSpec
 from whylogs.core.schema import DeclarativeSchema
 from whylogs.core.segmentation_partition import SegmentationPartition
 from whylogs.core.stubs import pd
-from whylogs.core.validators.validator import Validator
+from whylogs.core.validators.validator import Validator, deepcopy_validators
 from whylogs.experimental.core.metrics.udf_metric import (
     _reset_metric_udfs,
     generate_udf_resolvers,
@@ -194,7 +194,19 @@ class UdfSchema(DeclarativeSchema):
                 self.type_udfs[spec.column_type].append(spec)
 
     def copy(self) -> "UdfSchema":
-        copy = super().copy()
+        copy = UdfSchema(
+            [],
+            deepcopy(self.types),
+            deepcopy(self.default_configs),
+            deepcopy(self.type_mapper),
+            self.cache_size,
+            self.schema_based_automerge,
+            self.segments.copy(),
+            deepcopy_validators(self.validators),
+        )
+        copy.metadata = self.metadata.copy()
+        copy.resolvers = deepcopy(self.resolvers)
+        copy._columns = deepcopy(self._columns)
         copy.multicolumn_udfs = deepcopy(self.multicolumn_udfs)
         copy.type_udfs = deepcopy(self.type_udfs)
         return copy
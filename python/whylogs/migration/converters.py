@@ -55,6 +55,24 @@ _empty_theta_union = ds.theta_union()
 _empty_theta_union.update(ds.update_theta_sketch())
 EMPTY_THETA: bytes = _empty_theta_union.get_result().serialize()
 
+# resolved once so the per-column conversion loop avoids repeated enum lookups
+_T_INT, _T_BOOL, _T_FRAC, _T_STR, _T_OBJ, _T_NULL = (
+    InferredType.INTEGRAL,
+    InferredType.BOOLEAN,
+    InferredType.FRACTIONAL,
+    InferredType.STRING,
+    InferredType.UNKNOWN,
+    InferredType.NULL,
+)
+_N_DIST, _N_FI, _N_CNT, _N_TYPES, _N_CARD, _N_INTS = (
+    StandardMetric.distribution.name,
+    StandardMetric.frequent_items.name,
+    StandardMetric.counts.name,
+    StandardMetric.types.name,
+    StandardMetric.cardinality.name,
+    StandardMetric.ints.name,
+)
+
 logger = getLogger(__name__)
 
 PARTITION_ID = "segp_id"
@@ -115,40 +133,83 @@ def read_v0_to_view(path: str, allow_partial: bool = False) -> DatasetProfileVie
         return v0_to_v1_view(v0_msg, allow_partial)
 
 
-def v0_to_v1_view(msg: DatasetProfileMessageV0, allow_partial: bool = False) -> DatasetProfileView:
-    columns: Dict[str, ColumnProfileView] = {}
+def _build_view(
+    col_name: str, col_msg: ColumnMessageV0, allow_partial: bool, aggregated_errors: Dict[str, Dict[str, str]]
+) -> ColumnProfileView:
+    failed_metrics: Dict[str, str] = dict()
+    # descend into each submessage once; the trivial metrics are built inline from these locals
+    numbers = col_msg.numbers
+    # unset submessages are skipped rather than materialized; their fields would all read as proto defaults
+    if numbers.WhichOneof("numbers") == "longs":
+        longs = numbers.longs
+        int_max, int_min = longs.max, longs.min
+    else:
+        int_max = int_min = 0
+    counters = col_msg.counters
+    cardinality_metric = (
+        _extract_cardinality_metric(col_msg.cardinality_tracker)
+        if col_msg.HasField("cardinality_tracker")
+        else CardinalityMetric.zero()
+    )
+    # copy the proto map once so the lookups below hit a plain dict
+    type_counts = dict(col_msg.schema.typeCounts)
+    extracted_metrics: Dict[str, Metric] = {
+        _N_DIST: _extract_dist_metric(numbers),
+        _N_CNT: ColumnCountsMetric(
+            n=IntegralComponent._from_trusted_value(counters.count or 0),
+            null=IntegralComponent._from_trusted_value(
+                counters.null_count.value if counters.HasField("null_count") else 0
+            ),
+            inf=IntegralComponent._from_trusted_value(0),
+            nan=IntegralComponent._from_trusted_value(0),
+        ),
+        _N_TYPES: TypeCountersMetric(
+            integral=IntegralComponent._from_trusted_value(type_counts.get(_T_INT, 0)),
+            fractional=IntegralComponent._from_trusted_value(type_counts.get(_T_FRAC, 0)),
+            boolean=IntegralComponent._from_trusted_value(type_counts.get(_T_BOOL, 0)),
+            string=IntegralComponent._from_trusted_value(type_counts.get(_T_STR, 0)),
+            tensor=IntegralComponent._from_trusted_value(0),
+            object=IntegralComponent._from_trusted_value(type_counts.get(_T_OBJ, 0)),
+        ),
+        _N_CARD: cardinality_metric,
+        _N_INTS: IntsMetric(
+            max=MaxIntegralComponent._from_trusted_value(int_max), min=MinIntegralComponent._from_trusted_value(int_min)
+        ),
+    }
+
+    try:
+        fi_bytes = col_msg.frequent_items.sketch if col_msg.HasField("frequent_items") else b""
+        # an absent sketch has nothing to deserialize; start a fresh empty one with the v0 defaults
+        fi_sketch = (
+            ds.frequent_strings_sketch.deserialize(fi_bytes)
+            if fi_bytes
+            else ds.frequent_strings_sketch(_DEFAULT_V0_FI_LG_K)
+        )
+        fs = FrequentStringsComponent._from_trusted_value(fi_sketch)
+        extracted_metrics[_N_FI] = FrequentItemsMetric(frequent_strings=fs)
+    except Exception as e:
+        failure_message = f"Failed extracting ({_N_FI}) metric from v0 profile. Column: {col_name}: encountered {e}."
+        logger.error(failure_message)
+        if allow_partial:
+            failed_metrics[_N_FI] = f"{e}"
+        else:
+            raise DeserializationError(failure_message)
+    if failed_metrics:
+        aggregated_errors[col_name] = failed_metrics
+
+    return ColumnProfileView(metrics=extracted_metrics)
+
 
+def v0_to_v1_view(msg: DatasetProfileMessageV0, allow_partial: bool = False) -> DatasetProfileView:
     dataset_timestamp = datetime.datetime.fromtimestamp(msg.properties.data_timestamp / 1000.0, datetime.timezone.utc)
     creation_timestamp = datetime.datetime.fromtimestamp(
         msg.properties.session_timestamp / 1000.0, datetime.timezone.utc
     )
     aggregated_errors: Dict[str, Dict[str, str]] = dict()
-    for col_name, col_msg in msg.columns.items():
-        extracted_metrics: Dict[str, Metric] = dict()
-        failed_metrics: Dict[str, str] = dict()
-        extracted_metrics[StandardMetric.distribution.name] = _extract_dist_metric(col_msg)
-        extracted_metrics[StandardMetric.counts.name] = _extract_col_counts(col_msg)
-        extracted_metrics[StandardMetric.types.name] = _extract_type_counts_metric(col_msg)
-        extracted_metrics[StandardMetric.cardinality.name] = _extract_cardinality_metric(col_msg)
-        extracted_metrics[StandardMetric.ints.name] = _extract_ints_metric(col_msg)
-
-        try:
-            fs = FrequentStringsComponent(ds.frequent_strings_sketch.deserialize(col_msg.frequent_items.sketch))
-            extracted_metrics[StandardMetric.frequent_items.name] = FrequentItemsMetric(frequent_strings=fs)
-        except Exception as e:
-            failure_message = (
-                f"Failed extracting ({StandardMetric.frequent_items.name}) metric from v0 profile. "
-                f"Column: {col_name}: encountered {e}."
-            )
-            logger.error(failure_message)
-            if allow_partial:
-                failed_metrics[StandardMetric.frequent_items.name] = f"{e}"
-            else:
-                raise DeserializationError(failure_message)
-        if failed_metrics:
-            aggregated_errors[col_name] = failed_metrics
-
-        columns[col_name] = ColumnProfileView(metrics=extracted_metrics)
+    columns: Dict[str, ColumnProfileView] = {
+        col_name: _build_view(col_name, col_msg, allow_partial, aggregated_errors)
+        for col_name, col_msg in msg.columns.items()
+    }
     if aggregated_errors:
         warning_message = [f"column: {str(col)}->{aggregated_errors[col]}" for col in aggregated_errors]
         logger.warning(f"Encountered errors while converting to v1: {warning_message}")
@@ -182,12 +243,6 @@ def v0_to_v1_view(msg: DatasetProfileMessageV0, allow_partial: bool = False) ->
     return converted_profile
 
 
-def _extract_ints_metric(msg: ColumnMessageV0) -> IntsMetric:
-    int_max = msg.numbers.longs.max
-    int_min = msg.numbers.longs.min
-    return IntsMetric(max=MaxIntegralComponent(int_max), min=MinIntegralComponent(int_min))
-
-
 def _extract_numbers_message_v0(col_prof: ColumnProfileView) -> NumbersMessageV0:
     distribution_metric: DistributionMetric = col_prof.get_metric(DistributionMetric.get_namespace())
     variance_message = VarianceMessage()
@@ -208,27 +263,10 @@ def _extract_numbers_message_v0(col_prof: ColumnProfileView) -> NumbersMessageV0
     return msg_v0
 
 
-def _extract_type_counts_metric(msg: ColumnMessageV0) -> TypeCountersMetric:
-    int_count = msg.schema.typeCounts.get(InferredType.INTEGRAL)
-    bool_count = msg.schema.typeCounts.get(InferredType.BOOLEAN)
-    frac_count = msg.schema.typeCounts.get(InferredType.FRACTIONAL)
-    string_count = msg.schema.typeCounts.get(InferredType.STRING)
-    obj_count = msg.schema.typeCounts.get(InferredType.UNKNOWN)
-    return TypeCountersMetric(
-        integral=IntegralComponent(int_count or 0),
-        fractional=IntegralComponent(frac_count or 0),
-        boolean=IntegralComponent(bool_count or 0),
-        string=IntegralComponent(string_count or 0),
-        tensor=IntegralComponent(0),
-        object=IntegralComponent(obj_count or 0),
-    )
-
-
-def _extract_cardinality_metric(msg: ColumnMessageV0) -> CardinalityMetric:
-    sketch_message = msg.cardinality_tracker
-    if sketch_message:
-        hll_bytes = sketch_message.sketch
-        hll = HllComponent(ds.hll_sketch.deserialize(hll_bytes))
+def _extract_cardinality_metric(sketch_message: HllSketchMessageV0) -> CardinalityMetric:
+    hll_bytes = sketch_message.sketch
+    if hll_bytes:
+        hll = HllComponent._from_trusted_value(ds.hll_sketch.deserialize(hll_bytes))
         return CardinalityMetric(hll=hll)
     else:
         return CardinalityMetric.zero()
@@ -244,12 +282,12 @@ def _extract_schema_message_v0(col_prof: ColumnProfileView) -> SchemaMessageV0:
         counts = ColumnCountsMetric.zero()
 
     type_counts: Dict[int, int] = {}
-    type_counts[InferredType.INTEGRAL] = types.integral.value
-    type_counts[InferredType.BOOLEAN] = types.boolean.value
-    type_counts[InferredType.FRACTIONAL] = types.fractional.value
-    type_counts[InferredType.STRING] = types.string.value
-    type_counts[InferredType.UNKNOWN] = types.object.value
-    type_counts[InferredType.NULL] = counts.null.value
+    type_counts[_T_INT] = types.integral.value
+    type_counts[_T_BOOL] = types.boolean.value
+    type_counts[_T_FRAC] = types.fractional.value
+    type_counts[_T_STR] = types.string.value
+    type_counts[_T_OBJ] = types.object.value
+    type_counts[_T_NULL] = counts.null.value
 
     msg_v0 = SchemaMessageV0(
         typeCounts=type_counts,
@@ -258,17 +296,6 @@ def _extract_schema_message_v0(col_prof: ColumnProfileView) -> SchemaMessageV0:
     return msg_v0
 
 
-def _extract_col_counts(msg: ColumnMessageV0) -> ColumnCountsMetric:
-    count_n = msg.counters.count
-    count_null = msg.counters.null_count
-    return ColumnCountsMetric(
-        n=IntegralComponent(count_n or 0),
-        null=IntegralComponent(count_null.value or 0),
-        inf=IntegralComponent(0),
-        nan=IntegralComponent(0),
-    )
-
-
 def _extract_counters_v0(col_prof: ColumnProfileView) -> CountersV0:
     counts_metric: ColumnCountsMetric = col_prof.get_metric(ColumnCountsMetric.get_namespace())
     count_options = dict(count=0)
@@ -281,10 +308,12 @@ def _extract_counters_v0(col_prof: ColumnProfileView) -> CountersV0:
     return CountersV0(**count_options)
 
 
-def _extract_dist_metric(msg: ColumnMessageV0) -> DistributionMetric:
-    kll_bytes = msg.numbers.histogram
+def _deserialize_v0_kll(kll_bytes: bytes) -> ds.kll_doubles_sketch:
+    if not kll_bytes:
+        # no histogram was written for this column; sketches are mutable, so build a fresh one rather than share
+        return ds.kll_doubles_sketch(k=_DEFAULT_V0_KLL_K)
+
     floats_sk = None
-    doubles_sk: Optional[ds.kll_doubles_sketch] = None
     # If this is a V1 serialized message it will be a double kll sketch.
     try:
         floats_sk = ds.kll_floats_sketch.deserialize(kll_bytes)
@@ -295,16 +324,22 @@ def _extract_dist_metric(msg: ColumnMessageV0) -> DistributionMetric:
             f"kll encountered runtime error in old format which threw exception: {e}, attempting kll_doubles deserialization."
         )
     if floats_sk is None:
-        doubles_sk = ds.kll_doubles_sketch.deserialize(kll_bytes)
-    else:
-        doubles_sk = ds.kll_floats_sketch.float_to_doubles(floats_sk)
-
-    dist_mean = msg.numbers.variance.mean
-    dist_m2 = msg.numbers.variance.sum
+        return ds.kll_doubles_sketch.deserialize(kll_bytes)
+    if floats_sk.is_empty():
+        # nothing retained to widen, so skip the copy and start an equivalent empty doubles sketch
+        return ds.kll_doubles_sketch(k=floats_sk.get_k())
+    return ds.kll_floats_sketch.float_to_doubles(floats_sk)
+
+
+def _extract_dist_metric(msg: NumbersMessageV0) -> DistributionMetric:
+    doubles_sk = _deserialize_v0_kll(msg.histogram)
+    variance = msg.variance
+    dist_mean = variance.mean
+    dist_m2 = variance.sum
     return DistributionMetric(
-        kll=KllComponent(doubles_sk),
-        mean=FractionalComponent(dist_mean),
-        m2=FractionalComponent(dist_m2),
+        kll=KllComponent._from_trusted_value(doubles_sk),
+        mean=FractionalComponent._from_trusted_value(dist_mean),
+        m2=FractionalComponent._from_trusted_value(dist_m2),
     )
 
 